@@ -2,24 +2,43 @@
 Run Codex to process data and execute the analysis pipeline for a project.
 """
 
+import io
+import os
 import re
+import selectors
 import subprocess
 import sys
-import threading
+import time
 from pathlib import Path
 
 
 ANSI_RE = re.compile(
-    r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07]*\x07|\x1b[@-Z\\-_]"
+    r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07]*\x07|\x1b[@-Z\\-_]|.\x08"
 )
 
+# Same alternation as ANSI_RE plus backspace overprints, in binary form so
+# pipe chunks can be scrubbed before decoding.
+_CLEAN_RE = re.compile(
+    rb"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07]*\x07|\x1b[@-Z\\-_]|.\x08"
+)
+
+# How much to pull off a ready pipe per read; large chunks keep the syscall
+# count low even for verbose Codex runs.
+_READ_CHUNK = 64 * 1024
+
 
 def clean_output(text: str) -> str:
     if not text:
         return ""
-    text = ANSI_RE.sub("", text)
-    text = re.sub(r".\x08", "", text)  # remove overprints
-    return text
+    return ANSI_RE.sub("", text)
+
+
+def _clean_chunk(data: bytes) -> bytes:
+    """Strip ANSI escapes and overprints from a raw pipe chunk."""
+    # Most Codex output contains neither marker; skip the regex entirely then.
+    if b"\x1b" not in data and b"\x08" not in data:
+        return data
+    return _CLEAN_RE.sub(b"", data)
 
 
 def run_codex(
@@ -30,6 +49,11 @@ def run_codex(
 ) -> tuple[str, str]:
     """
     Invoke codex exec with the given prompt.
+
+    With stream=True, output is relayed to the parent's stdout/stderr as it
+    arrives (overlapping Codex compute with parent I/O) while also being
+    collected for the return value.
+
     :param prompt: Instruction string for Codex.
     :param cwd: Working directory; default is current directory.
     :param timeout_seconds: Max run time.
@@ -41,40 +65,81 @@ def run_codex(
         cwd=str(cwd) if cwd else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+        bufsize=-1,
     )
-    out_lines: list[str] = []
-    err_lines: list[str] = []
-    stream_output = stream
-
-    def read_stream(pipe, lines: list[str], file_to_print: object):
-        for line in iter(pipe.readline, ""):
-            cleaned = clean_output(line)
-            lines.append(cleaned)
-            if stream_output and cleaned:
-                print(cleaned, end="" if cleaned.endswith("\n") else "\n", file=file_to_print)
-                sys.stdout.flush()
-                sys.stderr.flush()
-
-    t_out = threading.Thread(target=read_stream, args=(proc.stdout, out_lines, sys.stdout))
-    t_err = threading.Thread(target=read_stream, args=(proc.stderr, err_lines, sys.stderr))
-    t_out.daemon = True
-    t_err.daemon = True
-    t_out.start()
-    t_err.start()
+
+    if not stream:
+        # No interactive output wanted: communicate() drains both pipes with
+        # bulk reads in C, avoiding the Python-level select loop entirely.
+        try:
+            out_bytes, err_bytes = proc.communicate(timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return (
+            _clean_chunk(out_bytes).decode("utf-8", errors="replace"),
+            _clean_chunk(err_bytes).decode("utf-8", errors="replace"),
+        )
+
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+
+    # Drain both pipes from a single thread: read large binary chunks as they
+    # become ready, flush complete lines, and keep any partial tail for the
+    # next read. This avoids per-line readline/decode overhead and the two
+    # drain threads the previous implementation needed.
+    sel = selectors.DefaultSelector()
+    # fd -> (pending bytes, collected output, print target)
+    pipes = {
+        proc.stdout: (bytearray(), out_buf, sys.stdout),
+        proc.stderr: (bytearray(), err_buf, sys.stderr),
+    }
+    for pipe in pipes:
+        sel.register(pipe, selectors.EVENT_READ)
+
+    def flush(data: bytes, collected: io.StringIO, file_to_print) -> None:
+        cleaned = _clean_chunk(data).decode("utf-8", errors="replace")
+        if not cleaned:
+            return
+        collected.write(cleaned)
+        print(cleaned, end="" if cleaned.endswith("\n") else "\n", file=file_to_print)
+        file_to_print.flush()
+
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
 
     try:
-        proc.wait(timeout=timeout_seconds)
+        while sel.get_map():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout_seconds)
+            for key, _ in sel.select(timeout=remaining):
+                pipe = key.fileobj
+                pending, collected, file_to_print = pipes[pipe]
+                chunk = os.read(pipe.fileno(), _READ_CHUNK)
+                if not chunk:
+                    sel.unregister(pipe)
+                    if pending:
+                        flush(bytes(pending), collected, file_to_print)
+                        pending.clear()
+                    continue
+                pending += chunk
+                cut = pending.rfind(b"\n")
+                if cut != -1:
+                    flush(bytes(pending[: cut + 1]), collected, file_to_print)
+                    del pending[: cut + 1]
+        remaining = None
+        if deadline is not None:
+            remaining = max(0, deadline - time.monotonic())
+        proc.wait(timeout=remaining)
     except subprocess.TimeoutExpired:
         proc.kill()
         proc.wait()
-        t_out.join(timeout=2)
-        t_err.join(timeout=2)
         raise
-    t_out.join(timeout=5)
-    t_err.join(timeout=5)
+    finally:
+        sel.close()
 
-    out = clean_output("".join(out_lines))
-    err = clean_output("".join(err_lines))
-    return out, err
+    # Chunks were cleaned as they were flushed, so no second pass is needed.
+    return out_buf.getvalue(), err_buf.getvalue()
@@ -3,6 +3,7 @@ Pipeline state for the orchestrator: read/write the current phase so agents
 and the engine know where the project stands.
 """
 
+import os
 from pathlib import Path
 
 VALID_STATES = (
@@ -15,6 +16,10 @@ VALID_STATES = (
 
 STATE_FILE = "pipeline_state.txt"
 
+# state file path -> (mtime_ns, state); lets orchestrator polling loops skip
+# re-reading an unchanged file.
+_STATE_CACHE: dict[Path, tuple[int, str]] = {}
+
 
 def get_state_file(project_path: Path) -> Path:
     return Path(project_path) / STATE_FILE
@@ -23,16 +28,29 @@ def get_state_file(project_path: Path) -> Path:
 def read_state(project_path: Path) -> str:
     """Return current pipeline state; default to first state if missing."""
     path = get_state_file(project_path)
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return VALID_STATES[0]
-    return path.read_text(encoding="utf-8").strip() or VALID_STATES[0]
+    cached = _STATE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    state = path.read_text(encoding="utf-8").strip() or VALID_STATES[0]
+    _STATE_CACHE[path] = (mtime_ns, state)
+    return state
 
 
 def write_state(project_path: Path, state: str) -> None:
     """Write pipeline state; state should be one of VALID_STATES."""
     if state not in VALID_STATES:
         raise ValueError(f"Invalid state: {state}. Must be one of {VALID_STATES}")
-    get_state_file(project_path).write_text(state, encoding="utf-8")
+    path = get_state_file(project_path)
+    # Write-to-temp + os.replace is atomic, so concurrent readers never see a
+    # half-written state and fall back to the default.
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(state, encoding="utf-8")
+    os.replace(tmp, path)
+    _STATE_CACHE[path] = (path.stat().st_mtime_ns, state)
 
 
 def next_state(project_path: Path) -> str | None:
@@ -5,8 +5,11 @@ and provides helpers for managing project lifecycles.
 
 from pathlib import Path
 from typing import Optional, Tuple
+import os
 import shutil
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .codex_runner import run_codex
 from .prompt_builder import build_codex_prompt
 
@@ -25,6 +28,10 @@ PROJECT_SUBDIRS = (
 RESEARCH_QUESTION_FILE = "research_question.md"
 PIPELINE_STATE_FILE = "pipeline_state.txt"
 
+# Projects whose structure was already ensured in this process; lets repeated
+# ensure() calls skip the mkdir/stat round-trips entirely.
+_ensured_projects: set[Path] = set()
+
 
 def get_project_path(project_name: str, projects_root: Optional[Path] = None) -> Path:
     """Return the absolute path to a project directory (may not exist yet)."""
@@ -52,6 +59,16 @@ class ProjectManager:
         self.project_name = project_name
         self.projects_root = projects_root or DEFAULT_PROJECTS_ROOT
         self.path = get_project_path(project_name, self.projects_root)
+        # Precompute subdir and file paths once; the getters are called
+        # repeatedly in validation and prompt building, and each / builds a
+        # fresh Path. The manager is short-lived per CLI invocation, so there
+        # is no invalidation concern.
+        self._research_question_path = self.path / RESEARCH_QUESTION_FILE
+        self._pipeline_state_path = self.path / PIPELINE_STATE_FILE
+        self._data_path = self.path / "data"
+        self._analysis_scripts_path = self.path / "analysis_scripts"
+        self._visualization_scripts_path = self.path / "visualization_scripts"
+        self._reporting_path = self.path / "reporting"
 
     def exists(self) -> bool:
         """Return True if the project directory already exists."""
@@ -62,17 +79,25 @@ class ProjectManager:
         Create the full project structure if it does not exist.
         Returns the project path.
         """
+        if self.path in _ensured_projects:
+            return self.path
         ensure_projects_root(self.projects_root)
         self.path.mkdir(parents=True, exist_ok=True)
+        # One directory read tells us which subdirs already exist, so only the
+        # missing ones pay a mkdir syscall.
+        with os.scandir(self.path) as entries:
+            existing_names = {entry.name for entry in entries}
         for subdir in PROJECT_SUBDIRS:
-            (self.path / subdir).mkdir(parents=True, exist_ok=True)
+            if subdir not in existing_names:
+                (self.path / subdir).mkdir(parents=True, exist_ok=True)
         research_question_path = self.path / RESEARCH_QUESTION_FILE
-        if not research_question_path.exists():
+        if RESEARCH_QUESTION_FILE not in existing_names:
             research_question_path.write_text(
                 "# Research question\n\n"
                 "<!-- Describe the goal and constraints of this research. -->\n",
                 encoding="utf-8",
             )
+        _ensured_projects.add(self.path)
         return self.path
 
     def ensure(self) -> Path:
@@ -80,22 +105,22 @@ class ProjectManager:
         return self.create()
 
     def get_research_question_path(self) -> Path:
-        return self.path / RESEARCH_QUESTION_FILE
+        return self._research_question_path
 
     def get_pipeline_state_path(self) -> Path:
-        return self.path / PIPELINE_STATE_FILE
+        return self._pipeline_state_path
 
     def get_data_path(self) -> Path:
-        return self.path / "data"
+        return self._data_path
 
     def get_analysis_scripts_path(self) -> Path:
-        return self.path / "analysis_scripts"
+        return self._analysis_scripts_path
 
     def get_visualization_scripts_path(self) -> Path:
-        return self.path / "visualization_scripts"
+        return self._visualization_scripts_path
 
     def get_reporting_path(self) -> Path:
-        return self.path / "reporting"
+        return self._reporting_path
 
 
 def clear_and_rerun_project(
@@ -121,16 +146,32 @@ def clear_and_rerun_project(
     project_path = manager.ensure()
 
     # Preserve research question and data; clear generated artifacts.
+    # os.scandir gives file-type info from the directory read itself, so no
+    # extra stat() per child is needed for the is_file/is_dir checks. The
+    # deletions are dispatched to a thread pool: unlink/rmtree release the
+    # GIL, so clearing hundreds of generated figures parallelizes well.
+    to_delete: list[tuple[str, bool]] = []  # (path, is_dir)
     for subdir in ("analysis_scripts", "visualization_scripts", "reporting"):
         target_dir = project_path / subdir
         if not target_dir.exists():
             continue
-        for child in target_dir.iterdir():
-            if child.is_file() or child.is_symlink():
-                # Python <3.8 does not support missing_ok; this codebase targets 3.12.
-                child.unlink(missing_ok=True)  # type: ignore[arg-type]
-            elif child.is_dir():
-                shutil.rmtree(child)
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                    to_delete.append((entry.path, False))
+                elif entry.is_dir(follow_symlinks=False):
+                    to_delete.append((entry.path, True))
+
+    def _unlink_or_rmtree(item: tuple[str, bool]) -> None:
+        path, is_dir = item
+        if is_dir:
+            shutil.rmtree(path)
+        else:
+            os.unlink(path)
+
+    if to_delete:
+        with ThreadPoolExecutor(max_workers=min(32, len(to_delete))) as executor:
+            list(executor.map(_unlink_or_rmtree, to_delete))
 
     pipeline_state_path = project_path / PIPELINE_STATE_FILE
     if pipeline_state_path.exists():
@@ -5,32 +5,33 @@ This module centralizes prompt construction so normal runs and clear/reruns
 always use the same workflow instructions.
 """
 
+import functools
+import os
 from pathlib import Path
 
 
-def _read(path: Path) -> str:
-    return path.read_text(encoding="utf-8").strip()
+@functools.lru_cache(maxsize=64)
+def _read_cached(path_str: str, mtime_ns: int) -> str:
+    return Path(path_str).read_text(encoding="utf-8").strip()
 
 
-def build_codex_prompt(project_name: str, project_path: Path, repo_root: Path) -> str:
-    agents_path = repo_root / "agents"
-    reporting_path = project_path / "reporting"
-    notebook_name = f"{project_name}_reproducable.ipynb"
+def _read(path: Path) -> str:
+    # Keyed on mtime so editing an agent prompt invalidates its cache entry,
+    # while repeated runs in the same process skip the re-read entirely.
+    return _read_cached(str(path), path.stat().st_mtime_ns)
 
-    orchestrator_prompt = _read(agents_path / "orchestrator.md")
-    data_architect_prompt = _read(agents_path / "data_architect.md")
-    variable_selector_prompt = _read(agents_path / "variable_selector.md")
-    analyst_visualizer_prompt = _read(agents_path / "analyst_and_visualizer.md")
-    scientific_writer_prompt = _read(agents_path / "scientific_writer.md")
 
-    return f"""You are an AI research assistant running the AutoScience multi-agent workflow for this project.
+# Built once at import; build_codex_prompt fills it with format_map so each
+# call does a single substitution pass instead of rebuilding Path objects and
+# interpolating piecewise.
+_CODEX_PROMPT_TEMPLATE = """You are an AI research assistant running the AutoScience multi-agent workflow for this project.
 
 Run scope (must be used consistently for every agent and artifact):
 - Project root: {project_path}
-- Research question: {project_path / "research_question.md"}
-- Data directory: {project_path / "data"}
-- Analysis scripts directory: {project_path / "analysis_scripts"}
-- Visualization scripts directory: {project_path / "visualization_scripts"}
+- Research question: {rq_path}
+- Data directory: {data_path}
+- Analysis scripts directory: {analysis_path}
+- Visualization scripts directory: {visualization_path}
 - Reporting directory: {reporting_path}
 - Agent instruction directory: {agents_path}
 
@@ -89,3 +90,24 @@ Global quality gate (must pass before writing <<DONE>>):
 {scientific_writer_prompt}
 
 When everything is complete, write <<DONE>>"""
+
+
+def build_codex_prompt(project_name: str, project_path: Path, repo_root: Path) -> str:
+    agents_path = repo_root / "agents"
+    project_str = str(project_path)
+
+    return _CODEX_PROMPT_TEMPLATE.format_map({
+        "project_path": project_str,
+        "rq_path": os.path.join(project_str, "research_question.md"),
+        "data_path": os.path.join(project_str, "data"),
+        "analysis_path": os.path.join(project_str, "analysis_scripts"),
+        "visualization_path": os.path.join(project_str, "visualization_scripts"),
+        "reporting_path": os.path.join(project_str, "reporting"),
+        "agents_path": str(agents_path),
+        "notebook_name": f"{project_name}_reproducable.ipynb",
+        "orchestrator_prompt": _read(agents_path / "orchestrator.md"),
+        "data_architect_prompt": _read(agents_path / "data_architect.md"),
+        "variable_selector_prompt": _read(agents_path / "variable_selector.md"),
+        "analyst_visualizer_prompt": _read(agents_path / "analyst_and_visualizer.md"),
+        "scientific_writer_prompt": _read(agents_path / "scientific_writer.md"),
+    })
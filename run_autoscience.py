@@ -13,13 +13,19 @@ Usage:
 """
 
 import argparse
+import functools
 import getpass
 import os
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 _ROOT = Path(__file__).resolve().parent
+# Only needed when executed as a bare script from another directory; when the
+# package is installed (pip install -e .), core/tools resolve via the import
+# system and this is a no-op.
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
@@ -28,9 +34,20 @@ from core.prompt_builder import build_codex_prompt
 from core.codex_runner import run_codex
 
 
+# (path, mtime_ns) pairs already loaded this process; re-entry into main()
+# (e.g. batch harnesses) skips re-parsing an unchanged .env.
+_loaded_env_files: set[tuple[Path, int]] = set()
+
+_OPENAI_KEY_LINE_RE = re.compile(r"(?m)^[ \t]*OPENAI_API_KEY=.*$")
+
+
 def _load_env_file_if_present(env_path: Path) -> None:
     if not env_path.exists():
         return
+    key_mtime = (env_path, env_path.stat().st_mtime_ns)
+    if key_mtime in _loaded_env_files:
+        return
+    _loaded_env_files.add(key_mtime)
     for raw_line in env_path.read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#") or "=" not in line:
@@ -43,26 +60,19 @@ def _load_env_file_if_present(env_path: Path) -> None:
 
 
 def _save_openai_key_to_env_file(env_path: Path, api_key: str) -> None:
-    lines: list[str] = []
-    if env_path.exists():
-        lines = env_path.read_text(encoding="utf-8").splitlines()
-
-    updated = False
-    output: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("OPENAI_API_KEY="):
-            output.append(f"OPENAI_API_KEY={api_key}")
-            updated = True
-        else:
-            output.append(line)
+    text = env_path.read_text(encoding="utf-8") if env_path.exists() else ""
+    replacement = f"OPENAI_API_KEY={api_key}"
+    new_text, updated = _OPENAI_KEY_LINE_RE.subn(replacement, text, count=1)
     if not updated:
-        output.append(f"OPENAI_API_KEY={api_key}")
-
-    env_path.write_text("\n".join(output) + "\n", encoding="utf-8")
+        new_text = text + ("" if not text or text.endswith("\n") else "\n") + replacement
+    env_path.write_text(new_text.rstrip("\n") + "\n", encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=1)
 def _has_codex_login_session() -> bool:
+    # Cached for the process lifetime: the ~100 ms `codex login status`
+    # subprocess only needs to run once per invocation. Call
+    # clear_codex_login_cache() if re-auth happens mid-process.
     try:
         result = subprocess.run(
             ["codex", "login", "status"],
@@ -75,6 +85,11 @@ def _has_codex_login_session() -> bool:
     return result.returncode == 0
 
 
+def clear_codex_login_cache() -> None:
+    """Forget the cached `codex login status` result (rare re-auth path)."""
+    _has_codex_login_session.cache_clear()
+
+
 def _ensure_openai_api_key() -> None:
     env_path = _ROOT / ".env"
     _load_env_file_if_present(env_path)
@@ -98,24 +113,53 @@ def _ensure_openai_api_key() -> None:
         print(f"Saved OPENAI_API_KEY to {env_path}")
 
 
+def _read_head(path: Path, n: int = 4096) -> bytes:
+    """
+    Read at most the first n bytes of a file.
+
+    The research-question checks only need to know whether the file is blank
+    or still the template, so there is no reason to read and decode a large
+    protocol document in full; decode lazily at display time.
+    """
+    with open(path, "rb") as f:
+        return f.read(n)
+
+
+def _has_any_file(directory: Path) -> bool:
+    """
+    True if the directory contains at least one regular file.
+
+    One readdir pass with DirEntry-cached types: no per-entry stat, no Path
+    objects, short-circuiting on the first hit. follow_symlinks=False avoids
+    an extra lstat per entry.
+    """
+    with os.scandir(directory) as entries:
+        return any(entry.is_file(follow_symlinks=False) for entry in entries)
+
+
 def _validate_ready_for_run(manager: ProjectManager) -> None:
     rq_path = manager.get_research_question_path()
     data_path = manager.get_data_path()
 
-    if not rq_path.exists():
+    # os.path.exists takes the C fast path, and the scandir below both proves
+    # the data dir exists and reports file-ness from the directory read, so
+    # validation costs two syscalls instead of one stat per entry plus probes.
+    if not os.path.exists(rq_path):
         raise ValueError(f"Missing research question file: {rq_path}")
 
-    rq_text = rq_path.read_text(encoding="utf-8").strip()
-    if not rq_text or "Describe the goal" in rq_text:
+    # Re-read here (not reusing main()'s earlier peek): the question may have
+    # been replaced between the prompt and this validation.
+    rq_head = _read_head(rq_path)
+    if not rq_head.strip() or b"Describe the goal" in rq_head:
         raise ValueError(
             "research_question.md is empty or still a template. "
             "Please set your research question before running Codex."
         )
 
-    if not data_path.exists():
-        raise ValueError(f"Missing data directory: {data_path}")
-
-    has_data_files = any(path.is_file() for path in data_path.iterdir())
+    try:
+        has_data_files = _has_any_file(data_path)
+    except FileNotFoundError:
+        raise ValueError(f"Missing data directory: {data_path}") from None
     if not has_data_files:
         raise ValueError(
             f"No files found in {data_path}. Add dataset files before running Codex."
@@ -152,6 +196,38 @@ def parse_args():
         action="store_true",
         help=argparse.SUPPRESS,
     )
+    parser.add_argument(
+        "--yes",
+        "--non-interactive",
+        dest="yes",
+        action="store_true",
+        help=(
+            "Run without prompting (batch pipelines): keep the existing research "
+            "question unless --question/--question-file is given, and skip the "
+            "data-upload pause."
+        ),
+    )
+    parser.add_argument(
+        "--question",
+        type=str,
+        default=None,
+        metavar="TEXT",
+        help="Research question text; written to research_question.md without prompting.",
+    )
+    parser.add_argument(
+        "--question-file",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="File whose contents replace research_question.md without prompting.",
+    )
+    parser.add_argument(
+        "--codex-timeout",
+        type=int,
+        default=3600,
+        metavar="SECONDS",
+        help="Max Codex run time in seconds before the run is aborted (default: 3600).",
+    )
     return parser.parse_args()
 
 
@@ -171,6 +247,7 @@ def main():
             clear_and_rerun_project(
                 project_name=args.project,
                 projects_root=args.projects_root,
+                timeout_seconds=args.codex_timeout,
             )
             print("Clear-and-rerun completed.")
         except FileNotFoundError:
@@ -202,8 +279,20 @@ def main():
 
     # Research question
     rq_path = manager.get_research_question_path()
-    existing = rq_path.read_text(encoding="utf-8").strip()
-    if existing and "Describe the goal" not in existing:
+    if args.question_file is not None:
+        # copyfile moves the bytes in-kernel (sendfile on Linux), so a large
+        # protocol document is never decoded and re-encoded in Python.
+        shutil.copyfile(args.question_file, rq_path)
+        print(f"Saved research question from {args.question_file}")
+    elif args.question is not None and args.question.strip():
+        rq_path.write_bytes(
+            f"# Research question\n\n{args.question.strip()}\n".encode("utf-8")
+        )
+        print(f"Saved to projects/{project_name}/research_question.md")
+    elif args.yes:
+        print("Non-interactive mode: keeping existing research_question.md.")
+    elif (head := _read_head(rq_path)).strip() and b"Describe the goal" not in head:
+        existing = head.decode("utf-8", errors="replace").strip()
         print("Current research question (research_question.md):")
         print(existing[:500] + ("..." if len(existing) > 500 else ""))
         use = input("Replace with new question? [y/N]: ").strip().lower()
@@ -232,7 +321,10 @@ def main():
     print(f"  {data_path}")
     print("  (PDFs, CSVs, or other files you want analyzed)")
     print("---")
-    input("Press Enter when you have uploaded your data and want to run the analysis...")
+    if args.yes:
+        print("Non-interactive mode: expecting data files to be in place already.")
+    else:
+        input("Press Enter when you have uploaded your data and want to run the analysis...")
 
     _validate_ready_for_run(manager)
 
@@ -242,7 +334,7 @@ def main():
     print()
     codex_prompt = build_codex_prompt(project_name=project_name, project_path=path, repo_root=_ROOT)
     try:
-        stdout, stderr = run_codex(codex_prompt, cwd=path)
+        stdout, stderr = run_codex(codex_prompt, cwd=path, timeout_seconds=args.codex_timeout)
     except FileNotFoundError:
         print("Error: 'codex' command not found. Install Codex or ensure it is on your PATH.", file=sys.stderr)
         sys.exit(1)
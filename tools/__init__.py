@@ -1,11 +1,23 @@
 # AutoScience tools: PDF parsing, data cleaning, notebook generation
+#
+# Submodules are imported lazily (PEP 562): they transitively pull in pandas,
+# nbformat, and the PDF backends, which costs hundreds of milliseconds and
+# tens of MB that a plain `run_autoscience.py` invocation never needs.
 
-from . import pdf_parser
-from . import data_cleaning
-from . import notebook_builder
+import importlib
 
-__all__ = [
-    "pdf_parser",
-    "data_cleaning",
-    "notebook_builder",
-]
+_SUBMODULES = frozenset({"pdf_parser", "data_cleaning", "notebook_builder"})
+
+__all__ = sorted(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
@@ -11,34 +11,156 @@ try:
 except ImportError:
     pd = None  # type: ignore
 
+try:
+    import pyarrow  # noqa: F401  (availability probe only)
+except ImportError:
+    pyarrow = None  # type: ignore
+
 
 def clean_csv(
     csv_path: Path,
     output_path: Optional[Path] = None,
     drop_duplicates: bool = True,
     drop_na_all: bool = False,
+    chunksize: Optional[int] = None,
+    strict_dedup: bool = False,
     **read_csv_kwargs: object,
-) -> "pd.DataFrame":
+) -> "Optional[pd.DataFrame]":
     """
     Load a CSV, apply basic cleaning, and optionally save.
     :param csv_path: Path to input CSV.
-    :param output_path: If set, write cleaned DataFrame here.
-    :param drop_duplicates: Remove duplicate rows.
+    :param output_path: If set, write cleaned DataFrame here. The suffix picks
+        the format: .parquet (recommended; zstd-compressed, ~5x smaller and
+        ~10x faster for downstream re-reads), .feather, or CSV otherwise.
+        Read results back with read_table.
+    :param drop_duplicates: Remove duplicate rows. By default duplicates are
+        detected via 64-bit row hashes (C-level, ~8 bytes per row for the
+        comparison) rather than full-row tuples; collision odds are ~1/2^64
+        per row.
     :param drop_na_all: Remove rows that are all NaN.
-    :param read_csv_kwargs: Passed to pandas.read_csv.
-    :return: Cleaned DataFrame.
+    :param strict_dedup: Use exact DataFrame.drop_duplicates instead of row
+        hashes, for callers that cannot tolerate any collision risk.
+    :param chunksize: If set, stream the CSV in chunks of this many rows and
+        write incrementally to output_path (required in this mode), keeping
+        peak memory at O(chunksize) instead of O(file). Returns None.
+        Streaming appends CSV text, so output_path must have a .csv suffix;
+        parquet/feather outputs need the full in-memory path.
+    :param read_csv_kwargs: Passed to pandas.read_csv. Pass dtype/schema hints
+        here to avoid object-dtype inference on wide files.
+    :return: Cleaned DataFrame, or None when streaming with chunksize.
     """
     if pd is None:
         raise ImportError("pandas is required for data cleaning. Install with: pip install pandas")
     path = Path(csv_path)
     if not path.exists():
         raise FileNotFoundError(f"CSV not found: {path}")
+    if chunksize is not None:
+        if output_path is None:
+            raise ValueError("chunksize requires output_path (chunks are written incrementally)")
+        if Path(output_path).suffix.lower() != ".csv":
+            raise ValueError(
+                "chunksize streams CSV text, so output_path must end in .csv; "
+                "use the in-memory path for parquet/feather output"
+            )
+        _clean_csv_chunked(
+            path,
+            Path(output_path),
+            drop_duplicates=drop_duplicates,
+            drop_na_all=drop_na_all,
+            chunksize=chunksize,
+            **read_csv_kwargs,
+        )
+        return None
+    if pyarrow is not None:
+        # The pyarrow engine parses 2-5x faster than the default C engine and
+        # the arrow dtype backend avoids object-dtype memory blowup; callers
+        # can still override either via read_csv_kwargs.
+        read_csv_kwargs.setdefault("engine", "pyarrow")
+        read_csv_kwargs.setdefault("dtype_backend", "pyarrow")
     df = pd.read_csv(path, **read_csv_kwargs)
     if drop_na_all:
-        df = df.dropna(how="all")
+        df = df.dropna(how="all", ignore_index=True)
     if drop_duplicates:
-        df = df.drop_duplicates()
+        if strict_dedup:
+            df = df.drop_duplicates(ignore_index=True)
+        else:
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+            df = df.loc[~row_hashes.duplicated().values].reset_index(drop=True)
     if output_path is not None:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
+        _write_table(df, Path(output_path))
     return df
+
+
+def _write_table(df: "pd.DataFrame", output_path: Path) -> None:
+    """Write a DataFrame in the format implied by output_path's suffix."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = output_path.suffix.lower()
+    if suffix == ".parquet":
+        # Binary columnar + compression: fewer bytes moved on every
+        # subsequent pipeline stage.
+        df.to_parquet(output_path, compression="zstd")
+    elif suffix == ".feather":
+        df.to_feather(output_path)
+    else:
+        df.to_csv(output_path, index=False)
+
+
+def read_table(path: Path) -> "pd.DataFrame":
+    """
+    Read a table written by clean_csv (or compatible), dispatching on suffix:
+    .parquet, .feather, or CSV otherwise. Symmetric counterpart to the
+    clean_csv output formats so downstream stages need no format switches.
+    :param path: Path to the table file.
+    :return: Loaded DataFrame.
+    """
+    if pd is None:
+        raise ImportError("pandas is required for data cleaning. Install with: pip install pandas")
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Table not found: {path}")
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    if suffix == ".feather":
+        return pd.read_feather(path)
+    return pd.read_csv(path)
+
+
+def _clean_csv_chunked(
+    path: Path,
+    output_path: Path,
+    drop_duplicates: bool,
+    drop_na_all: bool,
+    chunksize: int,
+    **read_csv_kwargs: object,
+) -> None:
+    """
+    Stream-clean a CSV chunk by chunk, appending to output_path (CSV only;
+    clean_csv rejects other suffixes before calling here).
+
+    Cross-chunk dedup keeps a running set of row hashes
+    (pd.util.hash_pandas_object, C-level) rather than materializing all seen
+    rows, so memory stays bounded by chunksize plus 8 bytes per unique row.
+    """
+    # The pyarrow engine does not support chunked iteration; the default C
+    # engine is used here regardless of what full-file reads prefer.
+    read_csv_kwargs.pop("engine", None)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    seen_hashes: set[int] = set()
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        for i, chunk in enumerate(pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs)):
+            if drop_na_all:
+                chunk = chunk.dropna(how="all")
+            if drop_duplicates:
+                hashes = pd.util.hash_pandas_object(chunk, index=False)
+                # Check-and-add per row so duplicates within the same chunk
+                # are dropped too, not just repeats of earlier chunks.
+                fresh = []
+                for h in hashes:
+                    if h in seen_hashes:
+                        fresh.append(False)
+                    else:
+                        seen_hashes.add(h)
+                        fresh.append(True)
+                chunk = chunk.loc[fresh]
+            chunk.to_csv(out, index=False, header=(i == 0))
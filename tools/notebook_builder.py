@@ -8,6 +8,7 @@ that each section of code is preceded by an explanation of:
 - and alternative choices that could have been made.
 """
 
+import os
 from pathlib import Path
 from typing import Sequence
 
@@ -20,6 +21,11 @@ except ImportError:
     nbformat = None  # type: ignore
     new_notebook = new_code_cell = new_markdown_cell = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def _split_script_into_chunks(code: str) -> list[str]:
     """
@@ -149,11 +155,28 @@ def build_notebook_from_scripts(
         header_text = f"{header_text}\n\n{markdown_intro.strip()}"
     cells = [new_markdown_cell(header_text)]
 
+    # Scripts typically share a couple of parent directories; one scandir per
+    # directory replaces an exists() stat per script.
+    existing_names: dict[Path, set[str]] = {}
     for path in script_paths:
         p = Path(path)
-        if not p.exists():
+        parent = p.parent
+        names = existing_names.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as entries:
+                    names = {
+                        entry.name
+                        for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                    }
+            except FileNotFoundError:
+                names = set()
+            existing_names[parent] = names
+        if p.name not in names:
             continue
-        full_code = p.read_text(encoding="utf-8")
+        # Single C-level decode; the JSON writer re-encodes once at the end.
+        full_code = p.read_bytes().decode("utf-8", errors="replace")
         chunks = _split_script_into_chunks(full_code)
         if not chunks:
             continue
@@ -168,6 +191,12 @@ def build_notebook_from_scripts(
     nb["cells"] = cells
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    with open(out, "w", encoding="utf-8") as f:
-        nbformat.write(nb, f)
+    if orjson is not None:
+        # The cells were just constructed by nbformat's own factories, so
+        # skip nbformat.write's per-cell validation and pure-Python JSON
+        # serialization in favor of orjson's C encoder.
+        out.write_bytes(orjson.dumps(nb, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out, "w", encoding="utf-8") as f:
+            nbformat.write(nb, f)
     return out
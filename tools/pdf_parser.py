@@ -1,47 +1,234 @@
 """
 PDF parsing for AutoScience: extract text and tables from PDFs.
-Uses PyPDF2 for text; extend with tabula or pdfplumber for tables if needed.
+Prefers pypdfium2 (PDFium C++ bindings, ~5-10x faster) for text and falls
+back to PyPDF2; uses pdfplumber for tables when installed.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Optional, Sequence, TextIO
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None  # type: ignore
 
 try:
     import PyPDF2
 except ImportError:
     PyPDF2 = None  # type: ignore
 
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None  # type: ignore
+
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+def iter_pdf_pages(pdf_path: Path) -> Iterator[str]:
     """
-    Extract raw text from a PDF file.
+    Yield the text of each PDF page in order, holding only one page in memory
+    at a time. Downstream tokenizers/cleaners can consume page-by-page instead
+    of receiving the whole document as one string.
     :param pdf_path: Path to the PDF.
-    :return: Concatenated text from all pages.
-    :raises ImportError: If PyPDF2 is not installed.
+    :raises ImportError: If neither pypdfium2 nor PyPDF2 is installed.
     :raises FileNotFoundError: If the file does not exist.
     """
-    if PyPDF2 is None:
-        raise ImportError("PyPDF2 is required for PDF text extraction. Install with: pip install PyPDF2")
+    if pdfium is None and PyPDF2 is None:
+        raise ImportError(
+            "pypdfium2 or PyPDF2 is required for PDF text extraction. "
+            "Install with: pip install pypdfium2"
+        )
     path = Path(pdf_path)
     if not path.exists():
         raise FileNotFoundError(f"PDF not found: {path}")
-    text_parts = []
+    if pdfium is not None:
+        # PDFium's content-stream parser runs in C++, avoiding PyPDF2's
+        # pure-Python hot path on large documents.
+        pdf = pdfium.PdfDocument(path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                yield textpage.get_text_range() or ""
+        finally:
+            pdf.close()
+        return
     with open(path, "rb") as f:
         reader = PyPDF2.PdfReader(f)
         for page in reader.pages:
-            text_parts.append(page.extract_text() or "")
-    return "\n\n".join(text_parts)
+            yield page.extract_text() or ""
+
+
+def _page_count(pdf_path: Path) -> int:
+    """Return the number of pages without extracting any text."""
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    with open(pdf_path, "rb") as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+def _extract_page_range(pdf_path_str: str, start: int, stop: int) -> tuple[int, list[str]]:
+    """
+    Worker for parallel extraction: open a fresh reader (readers are not
+    picklable, so each process gets the path plus an index range) and return
+    the texts for pages [start, stop).
+    """
+    path = Path(pdf_path_str)
+    texts: list[str] = []
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(path)
+        try:
+            for i in range(start, stop):
+                texts.append(pdf[i].get_textpage().get_text_range() or "")
+        finally:
+            pdf.close()
+    else:
+        with open(path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            for i in range(start, stop):
+                texts.append(reader.pages[i].extract_text() or "")
+    return start, texts
+
+
+def extract_text_from_pdf(
+    pdf_path: Path,
+    sink: Optional[TextIO] = None,
+    workers: int = 1,
+) -> str:
+    """
+    Extract raw text from a PDF file.
+    :param pdf_path: Path to the PDF.
+    :param sink: Optional file-like object; when given, page text is written
+        there directly (keeping peak memory at ~1 page) and "" is returned.
+    :param workers: When > 1, pages are decoded in parallel across a process
+        pool (page decoding is CPU-bound and embarrassingly parallel); pass
+        os.cpu_count() for large PDFs. Small PDFs should keep the default to
+        avoid fork overhead.
+    :return: Concatenated text from all pages, or "" when sink is given.
+    :raises ImportError: If neither pypdfium2 nor PyPDF2 is installed.
+    :raises FileNotFoundError: If the file does not exist.
+    """
+    if workers > 1:
+        pages = _extract_pages_parallel(pdf_path, workers)
+    else:
+        pages = iter_pdf_pages(pdf_path)
+    if sink is not None:
+        for i, page_text in enumerate(pages):
+            if i:
+                sink.write("\n\n")
+            sink.write(page_text)
+        return ""
+    return "\n\n".join(pages)
+
+
+def _extract_pages_parallel(pdf_path: Path, workers: int) -> list[str]:
+    """Fan page ranges out to a process pool and reassemble in page order."""
+    if pdfium is None and PyPDF2 is None:
+        raise ImportError(
+            "pypdfium2 or PyPDF2 is required for PDF text extraction. "
+            "Install with: pip install pypdfium2"
+        )
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    n_pages = _page_count(path)
+    if n_pages == 0:
+        return []
+    workers = min(workers, os.cpu_count() or 1, n_pages)
+    if workers <= 1:
+        return list(iter_pdf_pages(path))
+    # A few ranges per worker keeps the pool busy even when page costs vary.
+    range_size = max(1, n_pages // (4 * workers))
+    ranges = [
+        (start, min(start + range_size, n_pages))
+        for start in range(0, n_pages, range_size)
+    ]
+    pages: list[list[str]] = [[] for _ in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_extract_page_range, str(path), start, stop)
+            for start, stop in ranges
+        ]
+        for i, future in enumerate(futures):
+            _, texts = future.result()
+            pages[i] = texts
+    return [text for block in pages for text in block]
+
+
+# (path, st_mtime_ns, st_size) -> extracted text; iterative Codex pipelines
+# re-ingest the same corpus repeatedly, so unchanged files skip re-extraction.
+_EXTRACT_CACHE: dict[tuple[str, int, int], str] = {}
+
+
+def extract_text_from_pdfs(paths: Sequence[Path]) -> "dict[Path, str]":
+    """
+    Extract text from several PDFs, parallelizing across files.
+
+    PDF decoding is CPU-bound, so independent files are fanned out to a
+    process pool (one file per task). Results are memoized per
+    (path, mtime, size), so re-runs only pay for files that changed.
+
+    :param paths: PDF paths to extract.
+    :return: Mapping of input path -> extracted text, preserving input order.
+    :raises ImportError: If neither pypdfium2 nor PyPDF2 is installed.
+    :raises FileNotFoundError: If any file does not exist.
+    """
+    resolved = [Path(p) for p in paths]
+    results: dict[Path, str] = {}
+    pending: list[tuple[Path, tuple[str, int, int]]] = []
+    for path in resolved:
+        st = path.stat()  # raises FileNotFoundError for missing inputs
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _EXTRACT_CACHE.get(cache_key)
+        if cached is not None:
+            results[path] = cached
+        else:
+            pending.append((path, cache_key))
+
+    if pending:
+        if len(pending) == 1:
+            path, cache_key = pending[0]
+            text = extract_text_from_pdf(path)
+            _EXTRACT_CACHE[cache_key] = text
+            results[path] = text
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(len(pending), os.cpu_count() or 1)
+            ) as executor:
+                texts = executor.map(
+                    extract_text_from_pdf,
+                    [path for path, _ in pending],
+                    chunksize=1,
+                )
+                for (path, cache_key), text in zip(pending, texts):
+                    _EXTRACT_CACHE[cache_key] = text
+                    results[path] = text
+
+    # Rebuild in input order (dicts preserve insertion order).
+    return {path: results[path] for path in resolved}
 
 
 def extract_tables_from_pdf(pdf_path: Path) -> list[Any]:
     """
     Extract table-like structures from a PDF.
-    Default implementation returns an empty list; override or use a library
-    such as tabula-py or pdfplumber for real table extraction.
+    Uses pdfplumber when installed (C-accelerated pdfminer.six backend, no
+    JVM startup unlike tabula-py); returns an empty list otherwise.
     :param pdf_path: Path to the PDF.
-    :return: List of tables (e.g. list of lists or list of DataFrames).
+    :return: List of tables as lists of rows (each row a list of cell strings).
     """
-    # Placeholder: PyPDF2 does not provide table extraction. Projects can add
-    # tabula-py or pdfplumber and implement here.
-    _ = pdf_path
-    return []
+    if pdfplumber is None:
+        # No table backend available; callers treat an empty list as "none".
+        _ = pdf_path
+        return []
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    tables: list[Any] = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            tables.extend(page.extract_tables())
+    return tables